@@ -16,105 +16,22 @@ DATA STRUCTURES USED:
 import hashlib
 import json
 import os
-from datetime import date
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
 from collections import defaultdict, deque
 from flask import Flask, request, jsonify, render_template, session
+from scheduler import Scheduler
+
+try:
+    import fcntl
+except ImportError:  # Windows — DB lock falls back to per-process only
+    fcntl = None
 
 app = Flask(__name__)
 app.secret_key = "ironcore_secret_key_2024"
 
-# ─────────────────────────────────────────────
-#  DATA STRUCTURE 1: HASH MAP — Exercise Database
-#  category -> level -> [exercises]  O(1) lookup
-# ─────────────────────────────────────────────
-
-EXERCISE_DB = {
-    "chest": [
-        {"name": "Bench Press",            "level": "intermediate", "calories": 250, "sets": 4, "reps": 8},
-        {"name": "Push-Up",                "level": "beginner",     "calories": 150, "sets": 3, "reps": 15},
-        {"name": "Incline Dumbbell Press", "level": "intermediate", "calories": 220, "sets": 4, "reps": 10},
-        {"name": "Cable Fly",              "level": "advanced",     "calories": 200, "sets": 3, "reps": 12},
-        {"name": "Chest Dip",              "level": "intermediate", "calories": 210, "sets": 3, "reps": 10},
-        {"name": "Pec Deck Machine",       "level": "beginner",     "calories": 160, "sets": 3, "reps": 12},
-        {"name": "Decline Bench Press",    "level": "advanced",     "calories": 260, "sets": 4, "reps": 8},
-    ],
-    "back": [
-        {"name": "Pull-Up",             "level": "intermediate", "calories": 200, "sets": 4, "reps": 8},
-        {"name": "Bent-Over Row",       "level": "intermediate", "calories": 230, "sets": 4, "reps": 10},
-        {"name": "Lat Pulldown",        "level": "beginner",     "calories": 180, "sets": 3, "reps": 12},
-        {"name": "Deadlift",            "level": "advanced",     "calories": 400, "sets": 3, "reps": 5},
-        {"name": "Seated Cable Row",    "level": "beginner",     "calories": 170, "sets": 3, "reps": 12},
-        {"name": "T-Bar Row",           "level": "intermediate", "calories": 240, "sets": 4, "reps": 8},
-        {"name": "Single Arm Dumbbell Row","level":"intermediate","calories": 210, "sets": 3, "reps": 10},
-        {"name": "Hyperextension",      "level": "beginner",     "calories": 130, "sets": 3, "reps": 15},
-    ],
-    "legs": [
-        {"name": "Squat",                 "level": "intermediate", "calories": 350, "sets": 4, "reps": 8},
-        {"name": "Leg Press",             "level": "beginner",     "calories": 280, "sets": 3, "reps": 12},
-        {"name": "Romanian Deadlift",     "level": "intermediate", "calories": 300, "sets": 3, "reps": 10},
-        {"name": "Bulgarian Split Squat", "level": "advanced",     "calories": 320, "sets": 3, "reps": 10},
-        {"name": "Leg Curl",              "level": "beginner",     "calories": 160, "sets": 3, "reps": 12},
-        {"name": "Leg Extension",         "level": "beginner",     "calories": 150, "sets": 3, "reps": 12},
-        {"name": "Walking Lunges",        "level": "intermediate", "calories": 260, "sets": 3, "reps": 12},
-        {"name": "Calf Raises",           "level": "beginner",     "calories": 120, "sets": 4, "reps": 20},
-        {"name": "Box Jump",              "level": "advanced",     "calories": 340, "sets": 4, "reps": 8},
-        {"name": "Sumo Squat",            "level": "intermediate", "calories": 280, "sets": 3, "reps": 12},
-    ],
-    "shoulders": [
-        {"name": "Overhead Press",     "level": "intermediate", "calories": 220, "sets": 4, "reps": 8},
-        {"name": "Lateral Raise",      "level": "beginner",     "calories": 130, "sets": 3, "reps": 15},
-        {"name": "Arnold Press",       "level": "advanced",     "calories": 200, "sets": 4, "reps": 10},
-        {"name": "Face Pull",          "level": "beginner",     "calories": 120, "sets": 3, "reps": 15},
-        {"name": "Front Raise",        "level": "beginner",     "calories": 125, "sets": 3, "reps": 12},
-        {"name": "Upright Row",        "level": "intermediate", "calories": 190, "sets": 3, "reps": 10},
-        {"name": "Reverse Pec Deck",   "level": "intermediate", "calories": 150, "sets": 3, "reps": 12},
-        {"name": "Shrugs",             "level": "beginner",     "calories": 140, "sets": 3, "reps": 15},
-    ],
-    "arms": [
-        {"name": "Bicep Curl",          "level": "beginner",     "calories": 140, "sets": 3, "reps": 12},
-        {"name": "Tricep Dip",          "level": "intermediate", "calories": 160, "sets": 3, "reps": 10},
-        {"name": "Hammer Curl",         "level": "beginner",     "calories": 130, "sets": 3, "reps": 12},
-        {"name": "Skull Crusher",       "level": "intermediate", "calories": 150, "sets": 3, "reps": 12},
-        {"name": "Concentration Curl",  "level": "beginner",     "calories": 120, "sets": 3, "reps": 12},
-        {"name": "Cable Tricep Pushdown","level": "beginner",    "calories": 130, "sets": 3, "reps": 15},
-        {"name": "Preacher Curl",       "level": "intermediate", "calories": 145, "sets": 3, "reps": 10},
-        {"name": "Overhead Tricep Ext", "level": "intermediate", "calories": 140, "sets": 3, "reps": 12},
-        {"name": "Chin-Up",             "level": "advanced",     "calories": 180, "sets": 3, "reps": 8},
-    ],
-    "core": [
-        {"name": "Plank",              "level": "beginner",     "calories": 100, "sets": 3, "reps": 60},
-        {"name": "Hanging Leg Raise",  "level": "advanced",     "calories": 150, "sets": 3, "reps": 12},
-        {"name": "Cable Crunch",       "level": "intermediate", "calories": 120, "sets": 3, "reps": 15},
-        {"name": "Ab Wheel Rollout",   "level": "advanced",     "calories": 140, "sets": 3, "reps": 10},
-        {"name": "Russian Twist",      "level": "beginner",     "calories": 110, "sets": 3, "reps": 20},
-        {"name": "Mountain Climbers",  "level": "intermediate", "calories": 180, "sets": 3, "reps": 30},
-        {"name": "Bicycle Crunch",     "level": "beginner",     "calories": 115, "sets": 3, "reps": 20},
-        {"name": "Dragon Flag",        "level": "advanced",     "calories": 160, "sets": 3, "reps": 8},
-        {"name": "Side Plank",         "level": "beginner",     "calories": 90,  "sets": 3, "reps": 45},
-        {"name": "Decline Sit-Up",     "level": "intermediate", "calories": 130, "sets": 3, "reps": 15},
-    ],
-    "cardio": [
-        {"name": "Treadmill Run",   "level": "beginner",     "calories": 400, "sets": 1, "reps": 30},
-        {"name": "Cycling",         "level": "beginner",     "calories": 350, "sets": 1, "reps": 30},
-        {"name": "Jump Rope",       "level": "intermediate", "calories": 450, "sets": 5, "reps": 2},
-        {"name": "HIIT Sprints",    "level": "advanced",     "calories": 500, "sets": 8, "reps": 1},
-        {"name": "Rowing Machine",  "level": "intermediate", "calories": 420, "sets": 1, "reps": 20},
-        {"name": "Stair Climber",   "level": "intermediate", "calories": 380, "sets": 1, "reps": 20},
-        {"name": "Battle Ropes",    "level": "advanced",     "calories": 480, "sets": 6, "reps": 1},
-        {"name": "Burpees",         "level": "intermediate", "calories": 460, "sets": 5, "reps": 10},
-        {"name": "Box Step-Up",     "level": "beginner",     "calories": 300, "sets": 3, "reps": 15},
-        {"name": "Shadow Boxing",   "level": "beginner",     "calories": 320, "sets": 3, "reps": 3},
-    ],
-    "full_body": [
-        {"name": "Clean and Press",   "level": "advanced",     "calories": 420, "sets": 4, "reps": 5},
-        {"name": "Kettlebell Swing",  "level": "intermediate", "calories": 350, "sets": 4, "reps": 15},
-        {"name": "Thruster",          "level": "advanced",     "calories": 400, "sets": 4, "reps": 8},
-        {"name": "Man Maker",         "level": "advanced",     "calories": 380, "sets": 3, "reps": 8},
-        {"name": "Turkish Get-Up",    "level": "intermediate", "calories": 300, "sets": 3, "reps": 5},
-        {"name": "Dumbbell Complex",  "level": "intermediate", "calories": 340, "sets": 3, "reps": 8},
-    ],
-}
-
 GOAL_MUSCLE_MAP = {
     "weight_loss":     ["cardio", "legs", "core"],
     "muscle_gain":     ["chest", "back", "legs", "shoulders", "arms"],
@@ -128,24 +45,160 @@ GOAL_MUSCLE_MAP = {
 LEVEL_ORDER = {"beginner": 0, "intermediate": 1, "advanced": 2}
 
 # ─────────────────────────────────────────────
-#  DATA STRUCTURE 1: HASH MAP — Exercise Index
-# ─────────────────────────────────────────────
-EXERCISE_INDEX = defaultdict(lambda: defaultdict(list))
-
-def build_exercise_index():
+#  DATA STRUCTURE 1: HASH MAP — Exercise Catalog
+#  exercises.json is compiled once into a JSON
+#  index snapshot: category -> level -> [exercises]
+#  Loaded lazily, hot-reloaded when the source changes
+# ─────────────────────────────────────────────
+APP_DIR                = os.path.dirname(os.path.abspath(__file__))
+EXERCISE_CATALOG_FILE  = os.environ.get("IRONCORE_EXERCISE_CATALOG",
+                                        os.path.join(APP_DIR, "exercises.json"))
+EXERCISE_SNAPSHOT_FILE = os.path.splitext(EXERCISE_CATALOG_FILE)[0] + ".index.json"
+SNAPSHOT_VERSION       = 2
+CATALOG_CHECK_INTERVAL = 2.0  # seconds between source file checks (catalog_watch job)
+
+_catalog              = None  # current snapshot, swapped as a single reference
+_catalog_rejected     = None  # signature of a source file that failed to compile
+_catalog_checked_at   = 0.0   # last in-request check, used only without the scheduler
+_catalog_reload_lock  = threading.Lock()
+
+def _catalog_signature():
+    st = os.stat(EXERCISE_CATALOG_FILE)
+    return [SNAPSHOT_VERSION, st.st_mtime_ns, st.st_size]  # list, so it round-trips through JSON
+
+EXERCISE_INT_FIELDS = ("calories", "sets", "reps")
+
+def validate_exercise(category, ex):
+    """Raise ValueError for an entry the API could not serve"""
+    if not isinstance(ex, dict):
+        raise ValueError(f"{category}: exercise must be an object, got {ex!r}")
+    name = ex.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"{category}: exercise missing a name: {ex!r}")
+    if ex.get("level") not in LEVEL_ORDER:
+        raise ValueError(f"{category}/{name}: unknown level {ex.get('level')!r}")
+    for field in EXERCISE_INT_FIELDS:
+        value = ex.get(field)
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"{category}/{name}: {field} must be an integer, got {value!r}")
+
+def compile_exercise_catalog(exercise_db, signature):
+    """Build the index and every sort order the API serves, once per source version"""
+    if not isinstance(exercise_db, dict):
+        raise ValueError("exercise catalog must map category -> [exercises]")
+    index = {}
     # DATA STRUCTURE 5: SET — track unique categories
     active_categories = set()
-    for category, exercises in EXERCISE_DB.items():
+    for category, exercises in exercise_db.items():
+        if not isinstance(exercises, list):
+            raise ValueError(f"{category}: expected a list of exercises")
         active_categories.add(category)
+        levels = index.setdefault(category, {})
         for ex in exercises:
-            EXERCISE_INDEX[category][ex["level"]].append({**ex, "category": category})
-    return active_categories
+            validate_exercise(category, ex)
+            levels.setdefault(ex["level"], []).append({**ex, "category": category})
+
+    # DATA STRUCTURE 2: SORTING — per level by calories desc (recommendations)
+    for levels in index.values():
+        for level, exs in levels.items():
+            levels[level] = sorted(exs, key=lambda e: e["calories"], reverse=True)
+
+    # DATA STRUCTURE 2: SORTING — by level then calories desc (exercise browser)
+    browse_key = lambda e: (LEVEL_ORDER[e["level"]], -e["calories"])
+    browse = {cat: sorted((ex for exs in levels.values() for ex in exs), key=browse_key)
+              for cat, levels in index.items()}
+    browse_all = sorted((ex for exs in browse.values() for ex in exs), key=browse_key)
+
+    return {
+        "signature":  signature,
+        "index":      index,
+        "browse":     browse,
+        "browse_all": browse_all,
+        "categories": sorted(active_categories),
+    }
 
-ACTIVE_CATEGORIES = build_exercise_index()
+def _load_snapshot(signature):
+    # Plain JSON, never pickle: the snapshot sits next to an editable data file
+    try:
+        with open(EXERCISE_SNAPSHOT_FILE, "r") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None  # missing, truncated or corrupt — recompile
+    if not isinstance(snapshot, dict) or snapshot.get("signature") != signature:
+        return None
+    return snapshot
+
+def _save_snapshot(snapshot):
+    # Write beside the target then rename, so other workers never read half a file
+    tmp = f"{EXERCISE_SNAPSHOT_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.replace(tmp, EXERCISE_SNAPSHOT_FILE)
+    except OSError as e:
+        app.logger.warning("Could not write exercise index snapshot: %s", e)
+
+def _build_catalog():
+    signature = _catalog_signature()
+    snapshot  = _load_snapshot(signature)
+    if snapshot is None:
+        with open(EXERCISE_CATALOG_FILE, "r") as f:
+            snapshot = compile_exercise_catalog(json.load(f), signature)
+        _save_snapshot(snapshot)
+    return snapshot
+
+def reload_exercise_catalog():
+    """Swap in a new catalog if the source changed. Requests already
+    holding the old snapshot keep using it; a bad file is logged and skipped."""
+    global _catalog, _catalog_rejected
+    if not _catalog_reload_lock.acquire(blocking=False):
+        return False  # another thread is already reloading
+    try:
+        signature = _catalog_signature()
+        if signature == _catalog_rejected:
+            return False
+        if _catalog is not None and _catalog["signature"] == signature:
+            return False
+        try:
+            _catalog = _build_catalog()
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            _catalog_rejected = signature
+            app.logger.error("Exercise catalog %s rejected, keeping previous version: %s",
+                             EXERCISE_CATALOG_FILE, e)
+            return False
+        return True
+    except OSError as e:
+        app.logger.error("Exercise catalog reload failed: %s", e)
+        return False
+    finally:
+        _catalog_reload_lock.release()
+
+def get_catalog():
+    """Current catalog snapshot. Only the very first call loads it; source
+    changes are picked up by the catalog_watch background job, or by a
+    throttled check here when the scheduler is not running."""
+    global _catalog, _catalog_checked_at
+    catalog = _catalog
+    if catalog is None:
+        with _catalog_reload_lock:
+            if _catalog is None:
+                _catalog = _build_catalog()
+            return _catalog
+
+    now = time.monotonic()
+    if not scheduler.running and now - _catalog_checked_at >= CATALOG_CHECK_INTERVAL:
+        _catalog_checked_at = now
+        try:
+            signature = _catalog_signature()
+        except OSError:
+            signature = catalog["signature"]  # file mid-replace — keep serving
+        if signature not in (catalog["signature"], _catalog_rejected):
+            threading.Thread(target=reload_exercise_catalog, daemon=True).start()
+    return catalog
 
 def get_exercises(category, level):
-    """O(1) hash map lookup"""
-    return EXERCISE_INDEX.get(category, {}).get(level, [])
+    """O(1) hash map lookup, highest calories first"""
+    return get_catalog()["index"].get(category, {}).get(level, [])
 
 # ─────────────────────────────────────────────
 #  DATA STRUCTURE 4: QUEUE — Gym Occupancy Log
@@ -173,12 +226,47 @@ DEFAULT_EQUIPMENT = [
 # ─────────────────────────────────────────────
 #  DATABASE HELPERS
 # ─────────────────────────────────────────────
-DB_FILE = "gym_database.json"
+DB_FILE      = "gym_database.json"
+DB_LOCK_FILE = DB_FILE + ".lock"
+_db_thread_lock = threading.RLock()
+_db_lock_depth  = 0
+_db_lock_handle = None
+# (db_version, board) — a save from any worker changes the version
+LEADERBOARD_CACHE = {"entry": None}
+
+@contextmanager
+def db_lock():
+    """Held around every load -> modify -> save, by request handlers and
+    background jobs. Excludes other threads (RLock) and other worker
+    processes (fcntl on DB_LOCK_FILE); re-entrant within a thread."""
+    global _db_lock_depth, _db_lock_handle
+    with _db_thread_lock:
+        if _db_lock_depth == 0 and fcntl is not None:
+            handle = open(DB_LOCK_FILE, "a")
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            _db_lock_handle = handle
+        _db_lock_depth += 1
+        try:
+            yield
+        finally:
+            _db_lock_depth -= 1
+            if _db_lock_depth == 0 and _db_lock_handle is not None:
+                fcntl.flock(_db_lock_handle, fcntl.LOCK_UN)
+                _db_lock_handle.close()
+                _db_lock_handle = None
 
 def hash_password(password):
     """DATA STRUCTURE 1: Hashing — SHA256"""
     return hashlib.sha256(password.encode()).hexdigest()
 
+def db_version():
+    """Changes whenever any worker saves: save_db replaces the file (new inode)"""
+    try:
+        st = os.stat(DB_FILE)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
 def load_db():
     if os.path.exists(DB_FILE):
         with open(DB_FILE, "r") as f:
@@ -186,17 +274,23 @@ def load_db():
     return {}
 
 def save_db(db):
-    with open(DB_FILE, "w") as f:
+    # Write beside the target then rename, so readers never see half a file
+    tmp = f"{DB_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
         json.dump(db, f, indent=2)
+    os.replace(tmp, DB_FILE)
 
 def load_equipment():
     db = load_db()
-    return db.get("__equipment__", DEFAULT_EQUIPMENT)
+    if "__equipment__" in db:
+        return db["__equipment__"]
+    return [dict(e) for e in DEFAULT_EQUIPMENT]  # callers modify the list
 
 def save_equipment(equipment):
-    db = load_db()
-    db["__equipment__"] = equipment
-    save_db(db)
+    with db_lock():
+        db = load_db()
+        db["__equipment__"] = equipment
+        save_db(db)
 
 def calc_bmi(weight, height):
     h = height / 100
@@ -225,9 +319,8 @@ def recommend(goal, level):
         if not found:
             found = get_exercises(cat, "beginner")
         if found:
-            # DATA STRUCTURE 2: SORTING — pick highest calorie exercise
-            best = sorted(found, key=lambda e: e["calories"], reverse=True)[0]
-            exercises.append(best)
+            # DATA STRUCTURE 2: SORTING — index is precompiled highest calorie first
+            exercises.append(found[0])
     # DATA STRUCTURE 2: SORTING — sort full plan by calories desc
     return sorted(exercises, key=lambda e: e["calories"], reverse=True)
 
@@ -259,25 +352,26 @@ def register():
     if not all([username, password, age, weight, height]):
         return jsonify({"success": False, "message": "All fields are required"}), 400
 
-    db = load_db()
-    # DATA STRUCTURE 1: HASH MAP — O(1) check if user exists
-    if username in db or username == "__equipment__":
-        return jsonify({"success": False, "message": "Username already exists"}), 409
-
-    # DATA STRUCTURE 1: HASH MAP — store user by username key
-    db[username] = {
-        "username":      username,
-        "password_hash": hash_password(password),  # HASHING
-        "age":           age,
-        "weight":        weight,
-        "height":        height,
-        "goal":          goal,
-        "level":         level,
-        "joined":        str(date.today()),
-        "history":       []  # DATA STRUCTURE 3: STACK — newest workout on top
-    }
-    save_db(db)
-    return jsonify({"success": True, "message": "Account created!"})
+    with db_lock():
+        db = load_db()
+        # DATA STRUCTURE 1: HASH MAP — O(1) check if user exists
+        if username in db or username == "__equipment__":
+            return jsonify({"success": False, "message": "Username already exists"}), 409
+
+        # DATA STRUCTURE 1: HASH MAP — store user by username key
+        db[username] = {
+            "username":      username,
+            "password_hash": hash_password(password),  # HASHING
+            "age":           age,
+            "weight":        weight,
+            "height":        height,
+            "goal":          goal,
+            "level":         level,
+            "joined":        str(date.today()),
+            "history":       []  # DATA STRUCTURE 3: STACK — newest workout on top
+        }
+        save_db(db)
+        return jsonify({"success": True, "message": "Account created!"})
 
 
 @app.route("/api/login", methods=["POST"])
@@ -340,17 +434,18 @@ def save_workout():
     if "username" not in session:
         return jsonify({"success": False, "message": "Not logged in"}), 401
     data = request.json
-    db   = load_db()
-    # DATA STRUCTURE 3: STACK — insert at index 0 (push to top)
-    db[session["username"]]["history"].insert(0, {
-        "date":           str(date.today()),
-        "goal":           data["goal"],
-        "level":          data["level"],
-        "total_calories": data["total_calories"],
-        "exercises":      data["exercises"]
-    })
-    save_db(db)
-    return jsonify({"success": True, "message": "Workout saved!"})
+    with db_lock():
+        db   = load_db()
+        # DATA STRUCTURE 3: STACK — insert at index 0 (push to top)
+        db[session["username"]]["history"].insert(0, {
+            "date":           str(date.today()),
+            "goal":           data["goal"],
+            "level":          data["level"],
+            "total_calories": data["total_calories"],
+            "exercises":      data["exercises"]
+        })
+        save_db(db)
+        return jsonify({"success": True, "message": "Workout saved!"})
 
 # ─────────────────────────────────────────────
 #  MEMBER API — Exercises
@@ -359,19 +454,17 @@ def save_workout():
 def get_exercises_api():
     category = request.args.get("category", "all")
     keyword  = request.args.get("search", "").lower()
-    all_exs  = []
-    # DATA STRUCTURE 5: SET — get unique active categories
-    cats = list(ACTIVE_CATEGORIES) if category == "all" else [category]
-    for cat in cats:
-        for level_exs in EXERCISE_INDEX.get(cat, {}).values():
-            all_exs.extend(level_exs)
+    catalog  = get_catalog()
+    # DATA STRUCTURE 2: SORTING — precompiled by level then calories desc
+    if category == "all":
+        all_exs = catalog["browse_all"]
+    else:
+        all_exs = catalog["browse"].get(category, [])
     if keyword:
         all_exs = [e for e in all_exs if keyword in e["name"].lower()
                    or keyword in e["category"].lower() or keyword in e["level"].lower()]
-    # DATA STRUCTURE 2: SORTING — by level then calories desc
-    all_exs.sort(key=lambda e: (LEVEL_ORDER[e["level"]], -e["calories"]))
     return jsonify({"success": True, "exercises": all_exs,
-                    "categories": sorted(list(ACTIVE_CATEGORIES))})
+                    "categories": catalog["categories"]})
 
 # ─────────────────────────────────────────────
 #  MEMBER API — History
@@ -388,10 +481,11 @@ def get_history():
 def clear_history():
     if "username" not in session:
         return jsonify({"success": False, "message": "Not logged in"}), 401
-    db = load_db()
-    db[session["username"]]["history"] = []
-    save_db(db)
-    return jsonify({"success": True})
+    with db_lock():
+        db = load_db()
+        db[session["username"]]["history"] = []
+        save_db(db)
+        return jsonify({"success": True})
 
 # ─────────────────────────────────────────────
 #  MEMBER API — Profile
@@ -401,28 +495,35 @@ def update_profile():
     if "username" not in session:
         return jsonify({"success": False, "message": "Not logged in"}), 401
     data = request.json
-    db   = load_db()
-    user = db[session["username"]]
-    user["weight"] = float(data.get("weight", user["weight"]))
-    user["height"] = float(data.get("height", user["height"]))
-    user["goal"]   = data.get("goal",  user["goal"])
-    user["level"]  = data.get("level", user["level"])
-    save_db(db)
-    bmi = calc_bmi(user["weight"], user["height"])
-    return jsonify({"success": True, "bmi": bmi, "bmi_category": bmi_category(bmi)})
+    with db_lock():
+        db   = load_db()
+        user = db[session["username"]]
+        user["weight"] = float(data.get("weight", user["weight"]))
+        user["height"] = float(data.get("height", user["height"]))
+        user["goal"]   = data.get("goal",  user["goal"])
+        user["level"]  = data.get("level", user["level"])
+        save_db(db)
+        bmi = calc_bmi(user["weight"], user["height"])
+        return jsonify({"success": True, "bmi": bmi, "bmi_category": bmi_category(bmi)})
 
 # ─────────────────────────────────────────────
 #  MEMBER API — Leaderboard
 # ─────────────────────────────────────────────
-@app.route("/api/leaderboard", methods=["GET"])
-def leaderboard():
-    db = load_db()
+def build_leaderboard(db):
     # DATA STRUCTURE 2: SORTING — sort by workout count desc
-    board = sorted(
+    return sorted(
         [{"username": u["username"], "count": len(u["history"])}
          for k, u in db.items() if k != "__equipment__"],
         key=lambda x: x["count"], reverse=True
     )
+
+@app.route("/api/leaderboard", methods=["GET"])
+def leaderboard():
+    entry = LEADERBOARD_CACHE["entry"]
+    if entry is not None and entry[0] == db_version():
+        board = entry[1]
+    else:
+        board = refresh_leaderboard()
     return jsonify({"success": True, "leaderboard": board})
 
 # ─────────────────────────────────────────────
@@ -540,34 +641,36 @@ def admin_add_member():
     username = data.get("username", "").strip()
     if not username:
         return jsonify({"success": False, "message": "Username required"}), 400
-    db = load_db()
-    if username in db:
-        return jsonify({"success": False, "message": "Username already exists"}), 409
-    db[username] = {
-        "username":      username,
-        "password_hash": hash_password(data.get("password", "changeme123")),
-        "age":           int(data.get("age", 25)),
-        "weight":        float(data.get("weight", 70)),
-        "height":        float(data.get("height", 170)),
-        "goal":          data.get("goal",  "general_fitness"),
-        "level":         data.get("level", "beginner"),
-        "joined":        str(date.today()),
-        "history":       []
-    }
-    save_db(db)
-    return jsonify({"success": True, "message": f"{username} added!"})
+    with db_lock():
+        db = load_db()
+        if username in db:
+            return jsonify({"success": False, "message": "Username already exists"}), 409
+        db[username] = {
+            "username":      username,
+            "password_hash": hash_password(data.get("password", "changeme123")),
+            "age":           int(data.get("age", 25)),
+            "weight":        float(data.get("weight", 70)),
+            "height":        float(data.get("height", 170)),
+            "goal":          data.get("goal",  "general_fitness"),
+            "level":         data.get("level", "beginner"),
+            "joined":        str(date.today()),
+            "history":       []
+        }
+        save_db(db)
+        return jsonify({"success": True, "message": f"{username} added!"})
 
 
 @app.route("/api/admin/members/<username>", methods=["DELETE"])
 def admin_delete_member(username):
     if not session.get("is_admin"):
         return jsonify({"success": False, "message": "Unauthorized"}), 403
-    db = load_db()
-    if username not in db:
-        return jsonify({"success": False, "message": "Not found"}), 404
-    del db[username]
-    save_db(db)
-    return jsonify({"success": True})
+    with db_lock():
+        db = load_db()
+        if username not in db:
+            return jsonify({"success": False, "message": "Not found"}), 404
+        del db[username]
+        save_db(db)
+        return jsonify({"success": True})
 
 
 @app.route("/api/admin/members/<username>/history", methods=["GET"])
@@ -598,24 +701,25 @@ def add_equipment():
     if not session.get("is_admin"):
         return jsonify({"success": False, "message": "Unauthorized"}), 403
     data      = request.json
-    equipment = load_equipment()
-    # Generate new ID
-    new_id = max((e["id"] for e in equipment), default=0) + 1
-    new_item  = {
-        "id":           new_id,
-        "name":         data.get("name", ""),
-        "category":     data.get("category", "Other"),
-        "quantity":     int(data.get("quantity", 1)),
-        "condition":    data.get("condition", "Good"),
-        "status":       data.get("status", "Operational"),
-        "last_service": data.get("last_service", str(date.today())),
-        "next_service": data.get("next_service", ""),
-    }
-    if not new_item["name"]:
-        return jsonify({"success": False, "message": "Equipment name required"}), 400
-    equipment.append(new_item)
-    save_equipment(equipment)
-    return jsonify({"success": True, "message": f"{new_item['name']} added!", "equipment": new_item})
+    with db_lock():
+        equipment = load_equipment()
+        # Generate new ID
+        new_id = max((e["id"] for e in equipment), default=0) + 1
+        new_item  = {
+            "id":           new_id,
+            "name":         data.get("name", ""),
+            "category":     data.get("category", "Other"),
+            "quantity":     int(data.get("quantity", 1)),
+            "condition":    data.get("condition", "Good"),
+            "status":       data.get("status", "Operational"),
+            "last_service": data.get("last_service", str(date.today())),
+            "next_service": data.get("next_service", ""),
+        }
+        if not new_item["name"]:
+            return jsonify({"success": False, "message": "Equipment name required"}), 400
+        equipment.append(new_item)
+        save_equipment(equipment)
+        return jsonify({"success": True, "message": f"{new_item['name']} added!", "equipment": new_item})
 
 
 @app.route("/api/admin/equipment/<int:eq_id>", methods=["PUT"])
@@ -623,30 +727,32 @@ def update_equipment(eq_id):
     if not session.get("is_admin"):
         return jsonify({"success": False, "message": "Unauthorized"}), 403
     data      = request.json
-    equipment = load_equipment()
-    # DATA STRUCTURE 1: HASH MAP style lookup by id
-    for item in equipment:
-        if item["id"] == eq_id:
-            item["name"]         = data.get("name",         item["name"])
-            item["category"]     = data.get("category",     item["category"])
-            item["quantity"]     = int(data.get("quantity", item["quantity"]))
-            item["condition"]    = data.get("condition",    item["condition"])
-            item["status"]       = data.get("status",       item["status"])
-            item["last_service"] = data.get("last_service", item["last_service"])
-            item["next_service"] = data.get("next_service", item["next_service"])
-            save_equipment(equipment)
-            return jsonify({"success": True, "message": "Equipment updated!", "equipment": item})
-    return jsonify({"success": False, "message": "Equipment not found"}), 404
+    with db_lock():
+        equipment = load_equipment()
+        # DATA STRUCTURE 1: HASH MAP style lookup by id
+        for item in equipment:
+            if item["id"] == eq_id:
+                item["name"]         = data.get("name",         item["name"])
+                item["category"]     = data.get("category",     item["category"])
+                item["quantity"]     = int(data.get("quantity", item["quantity"]))
+                item["condition"]    = data.get("condition",    item["condition"])
+                item["status"]       = data.get("status",       item["status"])
+                item["last_service"] = data.get("last_service", item["last_service"])
+                item["next_service"] = data.get("next_service", item["next_service"])
+                save_equipment(equipment)
+                return jsonify({"success": True, "message": "Equipment updated!", "equipment": item})
+        return jsonify({"success": False, "message": "Equipment not found"}), 404
 
 
 @app.route("/api/admin/equipment/<int:eq_id>", methods=["DELETE"])
 def delete_equipment(eq_id):
     if not session.get("is_admin"):
         return jsonify({"success": False, "message": "Unauthorized"}), 403
-    equipment = load_equipment()
-    equipment = [e for e in equipment if e["id"] != eq_id]
-    save_equipment(equipment)
-    return jsonify({"success": True, "message": "Equipment removed"})
+    with db_lock():
+        equipment = load_equipment()
+        equipment = [e for e in equipment if e["id"] != eq_id]
+        save_equipment(equipment)
+        return jsonify({"success": True, "message": "Equipment removed"})
 
 # ─────────────────────────────────────────────
 #  FEATURE 3: ADMIN — Set Gym Occupancy
@@ -667,6 +773,85 @@ def set_occupancy():
     })
     return jsonify({"success": True, "count": current_gym_count})
 
+# ─────────────────────────────────────────────
+#  BACKGROUND JOBS — maintenance off the request path
+#  Disk-writing jobs are single-instance across workers;
+#  jobs that refresh in-process state run in every worker
+# ─────────────────────────────────────────────
+BACKUP_DIR      = os.path.join(APP_DIR, "backups")
+BACKUP_KEEP     = 28  # 6-hourly snapshots = one week
+JOB_LOCK_DIR    = os.path.join(APP_DIR, ".ironcore_locks")  # shared by every worker
+
+def refresh_service_status():
+    """Flag operational equipment whose next service date has passed.
+    Never clears a status — admins reset it after servicing."""
+    today = str(date.today())
+    with db_lock():
+        equipment = load_equipment()
+        changed   = False
+        for item in equipment:
+            if (item["status"] == "Operational" and item.get("next_service")
+                    and item["next_service"] <= today):
+                item["status"] = "Service Due"
+                changed = True
+        if changed:
+            save_equipment(equipment)
+
+def snapshot_database():
+    """Copy gym_database.json into BACKUP_DIR, keeping the newest BACKUP_KEEP"""
+    if not os.path.exists(DB_FILE):
+        return
+    with open(DB_FILE, "r") as f:
+        raw = f.read()
+    json.loads(raw)  # refuse to back up a half-written file; retried next slot
+    os.makedirs(BACKUP_DIR, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path  = os.path.join(BACKUP_DIR, f"gym_database-{stamp}.json")
+    with open(path + ".tmp", "w") as f:
+        f.write(raw)
+    os.replace(path + ".tmp", path)
+    # DATA STRUCTURE 2: SORTING — timestamped names sort oldest first
+    backups = sorted(n for n in os.listdir(BACKUP_DIR)
+                     if n.startswith("gym_database-") and n.endswith(".json"))
+    for name in backups[:-BACKUP_KEEP]:
+        os.remove(os.path.join(BACKUP_DIR, name))
+
+def refresh_leaderboard():
+    # Version is read before the data, so a save in between only forces another rebuild
+    version = db_version()
+    board   = build_leaderboard(load_db())
+    LEADERBOARD_CACHE["entry"] = (version, board)
+    return board
+
+def prune_occupancy_log():
+    """Drop check-in events from previous days"""
+    today = str(date.today())
+    # DATA STRUCTURE 4: QUEUE — oldest events sit at the front
+    while GYM_OCCUPANCY_LOG and GYM_OCCUPANCY_LOG[0]["time"] < today:
+        GYM_OCCUPANCY_LOG.popleft()
+
+scheduler = Scheduler(max_workers=2, lock_dir=JOB_LOCK_DIR, logger=app.logger)
+scheduler.add_interval_job("catalog_watch",       reload_exercise_catalog, CATALOG_CHECK_INTERVAL)
+scheduler.add_interval_job("refresh_leaderboard", refresh_leaderboard,     30, jitter=5)
+scheduler.add_cron_job("refresh_service_status",  refresh_service_status,  "0 * * * *",    jitter=60, single_instance=True)
+scheduler.add_cron_job("snapshot_database",       snapshot_database,       "30 */6 * * *", jitter=60, single_instance=True)
+scheduler.add_cron_job("prune_occupancy_log",     prune_occupancy_log,     "5 0 * * *",    jitter=30)
+
+SCHEDULER_ENABLED = os.environ.get("IRONCORE_SCHEDULER", "1") == "1"
+
+@app.before_request
+def start_scheduler():
+    # Started by the first request, not at import: the debug reloader imports
+    # this module in a watcher process too, and that process never serves
+    if SCHEDULER_ENABLED and not scheduler.running:
+        scheduler.start()
+
+@app.route("/api/admin/jobs", methods=["GET"])
+def admin_jobs():
+    if not session.get("is_admin"):
+        return jsonify({"success": False, "message": "Unauthorized"}), 403
+    return jsonify({"success": True, "pid": os.getpid(), "jobs": scheduler.status()})
+
 # ─────────────────────────────────────────────
 #  RUN
 # ─────────────────────────────────────────────
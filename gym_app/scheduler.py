@@ -0,0 +1,337 @@
+"""
+IRONCORE GymApp — Background Job Scheduler
+Runs maintenance work on a thread pool so it never sits on the request path.
+
+  Interval jobs : fire on wall-clock multiples of N seconds
+  Cron jobs     : standard 5-field spec  "minute hour day month weekday"
+  Jitter        : random delay added to each run so workers don't stampede
+  Single-instance jobs take a file lock (fcntl) and record the slot they ran,
+  so across several worker processes each slot runs exactly once. The same
+  record keeps the last result, so any worker can report it.
+"""
+
+import atexit
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+try:
+    import fcntl
+except ImportError:  # Windows — single-instance falls back to per-process only
+    fcntl = None
+
+
+def _iso(ts):
+    return datetime.fromtimestamp(ts).isoformat(timespec="seconds") if ts else None
+
+# ─────────────────────────────────────────────
+#  TRIGGERS — next_after(ts) returns the next slot
+# ─────────────────────────────────────────────
+class IntervalTrigger:
+    def __init__(self, seconds):
+        if seconds <= 0:
+            raise ValueError("interval must be positive")
+        self.seconds = seconds
+
+    def next_after(self, ts):
+        return (ts // self.seconds + 1) * self.seconds
+
+    def __str__(self):
+        return f"every {self.seconds:g}s"
+
+
+class CronTrigger:
+    # (low, high) bounds per field: minute hour day month weekday (0 = Sunday)
+    FIELDS = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, spec):
+        parts = spec.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron spec needs 5 fields: {spec!r}")
+        self.spec = spec
+        # DATA STRUCTURE 5: SET — allowed values per field
+        self.minutes, self.hours, self.days, self.months, weekdays = [
+            self._parse(p, lo, hi) for p, (lo, hi) in zip(parts, self.FIELDS)]
+        self.weekdays = {d % 7 for d in weekdays}
+        self.any_day     = parts[2] == "*"
+        self.any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse(field, lo, hi):
+        values = set()
+        for part in field.split(","):
+            rng, _, step = part.partition("/")
+            try:
+                if rng == "*":
+                    start, end = lo, hi
+                elif "-" in rng:
+                    start, end = map(int, rng.split("-"))
+                else:
+                    start = end = int(rng)
+                    if step:
+                        end = hi
+                step = int(step) if step else 1
+            except ValueError:
+                raise ValueError(f"cron field {field!r} is not a number, range or step") from None
+            if not lo <= start <= end <= hi or step <= 0:
+                raise ValueError(f"cron field {field!r} out of range {lo}-{hi}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt):
+        in_days     = dt.day in self.days
+        in_weekdays = (dt.weekday() + 1) % 7 in self.weekdays
+        # cron rule: if both day fields are restricted, either one matching is enough
+        if self.any_day or self.any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, ts):
+        dt    = datetime.fromtimestamp(ts).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt.year + 5
+        while dt.year <= limit:
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+            elif not self._day_matches(dt):
+                dt = (dt + timedelta(days=1)).replace(hour=0, minute=0)
+            elif dt.hour not in self.hours:
+                dt = (dt + timedelta(hours=1)).replace(minute=0)
+            elif dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+            else:
+                return dt.timestamp()
+        raise ValueError(f"cron spec {self.spec!r} never fires")
+
+    def __str__(self):
+        return f"cron {self.spec}"
+
+# ─────────────────────────────────────────────
+#  JOB — callable plus its run statistics
+# ─────────────────────────────────────────────
+class Job:
+    def __init__(self, name, func, trigger, jitter, single_instance):
+        self.name            = name
+        self.func            = func
+        self.trigger         = trigger
+        self.jitter          = jitter
+        self.single_instance = single_instance
+        self.slot            = None  # scheduled time before jitter
+        self.fire_at         = None  # slot + jitter
+        self.running         = False
+        self.runs            = 0
+        self.failures        = 0
+        self.skipped         = 0
+        self.total_duration  = 0.0
+        self.max_duration    = 0.0
+        self.last_started    = None
+        self.last_duration   = None
+        self.last_error      = None
+        self.last_error_at   = None
+
+    def schedule_after(self, ts):
+        self.slot    = self.trigger.next_after(ts)
+        self.fire_at = self.slot + random.uniform(0, self.jitter)
+
+    def status(self):
+        done = self.runs + self.failures
+        return {
+            "name":            self.name,
+            "trigger":         str(self.trigger),
+            "jitter":          self.jitter,
+            "single_instance": self.single_instance,
+            "running":         self.running,
+            "runs":            self.runs,
+            "failures":        self.failures,
+            "skipped":         self.skipped,
+            "last_started":    _iso(self.last_started),
+            "last_duration_ms": round(self.last_duration * 1000, 1) if self.last_duration is not None else None,
+            "avg_duration_ms": round(self.total_duration / done * 1000, 1) if done else None,
+            "max_duration_ms": round(self.max_duration * 1000, 1),
+            "last_error":      self.last_error,
+            "last_error_at":   _iso(self.last_error_at),
+            "next_run":        _iso(self.fire_at),
+        }
+
+# ─────────────────────────────────────────────
+#  SCHEDULER
+# ─────────────────────────────────────────────
+class Scheduler:
+    def __init__(self, max_workers=2, lock_dir=".locks", logger=None):
+        self.lock_dir  = lock_dir
+        self.logger    = logger or logging.getLogger(__name__)
+        self._jobs     = {}  # DATA STRUCTURE 1: HASH MAP — name -> Job
+        self._cond     = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ironcore-job")
+        self._thread   = None
+        self._stopping = False
+
+    def add_interval_job(self, name, func, seconds, jitter=0, single_instance=False):
+        return self._add(Job(name, func, IntervalTrigger(seconds), jitter, single_instance))
+
+    def add_cron_job(self, name, func, spec, jitter=0, single_instance=False):
+        return self._add(Job(name, func, CronTrigger(spec), jitter, single_instance))
+
+    def _add(self, job):
+        with self._cond:
+            if job.name in self._jobs:
+                raise ValueError(f"job {job.name!r} already registered")
+            job.schedule_after(time.time())
+            self._jobs[job.name] = job
+            self._cond.notify()
+        return job
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stopping
+
+    def start(self):
+        with self._cond:
+            if self._thread is not None:
+                return
+            if fcntl is not None and any(j.single_instance for j in self._jobs.values()):
+                os.makedirs(self.lock_dir, exist_ok=True)
+            self._stopping = False
+            self._thread = threading.Thread(target=self._loop, name="ironcore-scheduler", daemon=True)
+            self._thread.start()
+        atexit.register(self.shutdown, wait=False)
+
+    def shutdown(self, wait=True):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._executor.shutdown(wait=wait)
+
+    def status(self):
+        with self._cond:
+            jobs = [job.status() for job in self._jobs.values()]
+        for job in jobs:
+            if job["single_instance"]:
+                job["last_claim"] = self._read_claim(job["name"])
+        # DATA STRUCTURE 2: SORTING — by job name
+        return sorted(jobs, key=lambda j: j["name"])
+
+    def _loop(self):
+        with self._cond:
+            while not self._stopping:
+                now = time.time()
+                for job in self._jobs.values():
+                    if job.fire_at > now:
+                        continue
+                    if job.running:
+                        job.skipped += 1  # previous run still going — never overlap
+                    else:
+                        job.running = True
+                        try:
+                            self._executor.submit(self._execute, job, job.slot)
+                        except RuntimeError:  # executor shut down — interpreter exiting
+                            job.running    = False
+                            self._stopping = True
+                            return
+                    # Missed slots are dropped rather than replayed in a burst
+                    job.schedule_after(max(now, job.slot))
+                next_fire = min((j.fire_at for j in self._jobs.values()), default=now + 60)
+                self._cond.wait(timeout=max(0.0, min(next_fire - now, 60)))
+
+    def _execute(self, job, slot):
+        started = time.monotonic()
+        ran     = False
+        try:
+            with self._claim(job, slot) as claimed:
+                if claimed:
+                    ran = True
+                    job.last_started = time.time()
+                    job.func()
+        except Exception as e:
+            job.failures     += 1
+            job.last_error    = f"{type(e).__name__}: {e}"
+            job.last_error_at = time.time()
+            self.logger.exception("Background job %s failed", job.name)
+        else:
+            if ran:
+                job.runs += 1
+            else:
+                job.skipped += 1
+        finally:
+            if ran:
+                job.last_duration   = time.monotonic() - started
+                job.total_duration += job.last_duration
+                job.max_duration    = max(job.max_duration, job.last_duration)
+            job.running = False
+
+    # ─────────────────────────────────────────
+    #  CROSS-WORKER LOCKING
+    #  <lock_dir>/<job>.lock holds the last claimed slot
+    #  and the result of the run, whichever worker made it
+    # ─────────────────────────────────────────
+    def _lock_path(self, name):
+        return os.path.join(self.lock_dir, f"{name}.lock")
+
+    @contextmanager
+    def _claim(self, job, slot):
+        if not job.single_instance or fcntl is None:
+            yield True
+            return
+        with open(self._lock_path(job.name), "a+") as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False  # another worker is running it right now
+                return
+            try:
+                f.seek(0)
+                try:
+                    claim = json.loads(f.read() or "{}")
+                except ValueError:
+                    claim = {}
+                if claim.get("slot", 0) >= slot:
+                    yield False  # another worker already ran this slot
+                    return
+                claim.update(slot=slot, pid=os.getpid(), claimed_at=time.time(),
+                             finished_at=None, duration=None, error=None)
+                self._write_claim(f, claim)
+                started = time.monotonic()
+                try:
+                    yield True
+                except Exception as e:
+                    claim["error"]    = f"{type(e).__name__}: {e}"
+                    claim["failures"] = claim.get("failures", 0) + 1
+                    raise
+                else:
+                    claim["runs"] = claim.get("runs", 0) + 1
+                finally:
+                    claim["duration"]    = time.monotonic() - started
+                    claim["finished_at"] = time.time()
+                    self._write_claim(f, claim)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _write_claim(f, claim):
+        f.seek(0)
+        f.truncate()
+        json.dump(claim, f)
+        f.flush()
+
+    def _read_claim(self, name):
+        try:
+            with open(self._lock_path(name), "r") as f:
+                claim = json.load(f)
+        except (OSError, ValueError):
+            return None
+        duration = claim.get("duration")
+        return {
+            "pid":         claim.get("pid"),
+            "slot":        _iso(claim.get("slot")),
+            "claimed_at":  _iso(claim.get("claimed_at")),
+            "finished_at": _iso(claim.get("finished_at")),
+            "duration_ms": round(duration * 1000, 1) if duration is not None else None,
+            "error":       claim.get("error"),
+            "runs":        claim.get("runs", 0),
+            "failures":    claim.get("failures", 0),
+        }
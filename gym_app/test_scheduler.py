@@ -0,0 +1,136 @@
+"""Tests for the background job scheduler — triggers and cross-worker claims"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from scheduler import CronTrigger, IntervalTrigger, Job, Scheduler, fcntl
+
+
+def next_fire(spec, dt):
+    return datetime.fromtimestamp(CronTrigger(spec).next_after(dt.timestamp()))
+
+# ─────────────────────────────────────────────
+#  IntervalTrigger
+# ─────────────────────────────────────────────
+def test_interval_fires_on_wall_clock_multiples():
+    trigger = IntervalTrigger(30)
+    assert trigger.next_after(1000) == 1020
+    assert trigger.next_after(1020) == 1050  # on a slot -> the following one
+    assert trigger.next_after(1049.9) == 1050
+
+def test_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        IntervalTrigger(0)
+
+# ─────────────────────────────────────────────
+#  CronTrigger
+# ─────────────────────────────────────────────
+BASE = datetime(2026, 1, 14, 23, 42, 10)  # a Wednesday
+
+@pytest.mark.parametrize("spec, expected", [
+    ("0 * * * *",     datetime(2026, 1, 15, 0, 0)),
+    ("*/15 * * * *",  datetime(2026, 1, 14, 23, 45)),
+    ("30 */6 * * *",  datetime(2026, 1, 15, 0, 30)),
+    ("5 0 * * *",     datetime(2026, 1, 15, 0, 5)),
+    ("0 9 1-3 * *",   datetime(2026, 2, 1, 9, 0)),
+    ("0 0 29 2 *",    datetime(2028, 2, 29, 0, 0)),
+])
+def test_cron_next_after(spec, expected):
+    assert next_fire(spec, BASE) == expected
+
+def test_cron_never_returns_the_current_minute():
+    assert next_fire("42 23 * * *", BASE) == datetime(2026, 1, 15, 23, 42)
+
+def test_cron_weekday_only_when_day_of_month_is_star():
+    # Monday, any day of the month
+    assert next_fire("0 9 * * 1", BASE) == datetime(2026, 1, 19, 9, 0)
+
+def test_cron_day_of_month_only_when_weekday_is_star():
+    assert next_fire("0 9 20 * *", BASE) == datetime(2026, 1, 20, 9, 0)
+
+def test_cron_day_and_weekday_both_restricted_match_either():
+    # the 20th (Tuesday) or any Friday — Friday the 16th comes first
+    assert next_fire("0 9 20 * 5", BASE) == datetime(2026, 1, 16, 9, 0)
+    assert next_fire("0 9 15 * 5", BASE) == datetime(2026, 1, 15, 9, 0)
+
+def test_cron_weekday_seven_is_sunday():
+    assert next_fire("0 9 * * 7", BASE) == next_fire("0 9 * * 0", BASE) == datetime(2026, 1, 18, 9, 0)
+
+@pytest.mark.parametrize("spec", [
+    "* * * *",        # too few fields
+    "60 * * * *",     # minute out of range
+    "*/0 * * * *",    # zero step
+    "0 0-25 * * *",   # hour range out of range
+    "x * * * *",      # not a number
+])
+def test_cron_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        CronTrigger(spec)
+
+def test_cron_zero_step_reports_field():
+    with pytest.raises(ValueError, match=r"cron field '\*/0' out of range"):
+        CronTrigger("*/0 * * * *")
+
+def test_cron_that_never_fires():
+    with pytest.raises(ValueError, match="never fires"):
+        CronTrigger("0 0 31 2 *").next_after(BASE.timestamp())
+
+# ─────────────────────────────────────────────
+#  Scheduler._claim — one run per slot across workers
+# ─────────────────────────────────────────────
+needs_fcntl = pytest.mark.skipif(fcntl is None, reason="single-instance locking needs fcntl")
+
+def make_job():
+    return Job("nightly", lambda: None, IntervalTrigger(60), 0, single_instance=True)
+
+def claim(scheduler, job, slot):
+    with scheduler._claim(job, slot) as claimed:
+        return claimed
+
+@needs_fcntl
+def test_claim_runs_each_slot_once_across_workers(tmp_path):
+    worker_a = Scheduler(lock_dir=str(tmp_path))
+    worker_b = Scheduler(lock_dir=str(tmp_path))
+    job = make_job()
+    assert claim(worker_a, job, 1200) is True
+    assert claim(worker_b, job, 1200) is False  # same slot, other worker
+    assert claim(worker_a, job, 1200) is False
+    assert claim(worker_b, job, 1260) is True   # next slot
+
+@needs_fcntl
+def test_claim_skips_while_another_worker_holds_the_lock(tmp_path):
+    worker_a = Scheduler(lock_dir=str(tmp_path))
+    worker_b = Scheduler(lock_dir=str(tmp_path))
+    job = make_job()
+    with worker_a._claim(job, 1200) as claimed:
+        assert claimed
+        assert claim(worker_b, job, 1260) is False
+
+@needs_fcntl
+def test_claim_records_result_for_every_worker(tmp_path):
+    worker_a = Scheduler(lock_dir=str(tmp_path))
+    worker_b = Scheduler(lock_dir=str(tmp_path))
+    job = make_job()
+    claim(worker_a, job, 1200)
+    with pytest.raises(RuntimeError):
+        with worker_a._claim(job, 1260):
+            raise RuntimeError("disk full")
+    with open(tmp_path / "nightly.lock") as f:
+        record = json.load(f)
+    assert record["slot"] == 1260
+    assert record["runs"] == 1 and record["failures"] == 1
+    assert record["error"] == "RuntimeError: disk full"
+    assert record["finished_at"] is not None
+
+    worker_b._jobs[job.name] = job
+    shared = worker_b.status()[0]["last_claim"]
+    assert shared["error"] == "RuntimeError: disk full"
+    assert shared["failures"] == 1
+
+def test_claim_without_single_instance_always_runs(tmp_path):
+    scheduler = Scheduler(lock_dir=str(tmp_path))
+    job = Job("watch", lambda: None, IntervalTrigger(2), 0, single_instance=False)
+    assert claim(scheduler, job, 10) is True
+    assert claim(scheduler, job, 10) is True